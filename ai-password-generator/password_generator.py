@@ -8,12 +8,55 @@ import random
 import string
 import secrets
 import argparse
+from itertools import product
 from typing import List, Dict
 
 
+SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+# Deletion table for characters that are easy to confuse (0/O, 1/l/I)
+_AMBIG_TRANS = str.maketrans('', '', "0O1lI")
+
+# Character-class bits used by the strength analyzer
+LOWER, UPPER, DIGIT, SYMBOL = 1, 2, 4, 8
+
+
+def _build_class_table() -> bytes:
+    """Build a 256-entry table mapping each ASCII byte to its class bits"""
+    table = bytearray(256)
+    for chars, bit in ((string.ascii_lowercase, LOWER), (string.ascii_uppercase, UPPER),
+                       (string.digits, DIGIT), (SYMBOLS, SYMBOL)):
+        for c in chars:
+            table[ord(c)] |= bit
+    return bytes(table)
+
+
+CLASS_TABLE = _build_class_table()
+
+# Deletion tables splitting memorable passwords into letters and the rest
+_DROP_LETTERS = str.maketrans('', '', string.ascii_letters)
+_DROP_NON_LETTERS = str.maketrans('', '', string.digits + string.punctuation)
+
+
+def _random_string(table: bytes, rejected: bytes, length: int) -> str:
+    """Map bulk secrets.token_bytes output through a sampling table"""
+    password = b""
+    while len(password) < length:
+        password += secrets.token_bytes(length * 2).translate(table, rejected)
+    return password[:length].decode('ascii')
+
+
 class PasswordGenerator:
     """Smart password generator with AI-like patterns"""
     
+    # Common words for memorable passwords
+    _WORDS = (
+        'Apple', 'Beach', 'Cloud', 'Dream', 'Eagle', 'Fire', 'Green', 'Happy',
+        'Island', 'Jump', 'King', 'Light', 'Moon', 'Night', 'Ocean', 'Peace',
+        'Quick', 'River', 'Star', 'Tree', 'Unity', 'Voice', 'Water', 'Xray',
+        'Yellow', 'Zebra', 'Magic', 'Power', 'Swift', 'Brave'
+    )
+    
     def __init__(self):
         self.patterns = {
             'secure': {
@@ -50,37 +93,56 @@ class PasswordGenerator:
             }
         }
         
-        # Common words for memorable passwords
-        self.words = [
-            'Apple', 'Beach', 'Cloud', 'Dream', 'Eagle', 'Fire', 'Green', 'Happy',
-            'Island', 'Jump', 'King', 'Light', 'Moon', 'Night', 'Ocean', 'Peace',
-            'Quick', 'River', 'Star', 'Tree', 'Unity', 'Voice', 'Water', 'Xray',
-            'Yellow', 'Zebra', 'Magic', 'Power', 'Swift', 'Brave'
-        ]
+        # Only 32 option combinations exist, so build every character set once
+        self._charset_cache: Dict[tuple, str] = {
+            options: self._build_character_set(*options)
+            for options in product((False, True), repeat=5)
+        }
+        self._sampling_cache: Dict[str, tuple] = {}
     
-    def get_character_sets(self, config: Dict) -> str:
-        """Get character sets based on configuration"""
+    @staticmethod
+    def _build_character_set(use_lowercase: bool, use_uppercase: bool, use_numbers: bool,
+                             use_symbols: bool, avoid_ambiguous: bool) -> str:
+        """Build the character set for one combination of options"""
         chars = ""
         
-        if config['use_lowercase']:
+        if use_lowercase:
             chars += string.ascii_lowercase
         
-        if config['use_uppercase']:
+        if use_uppercase:
             chars += string.ascii_uppercase
         
-        if config['use_numbers']:
+        if use_numbers:
             chars += string.digits
         
-        if config['use_symbols']:
-            chars += "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        if use_symbols:
+            chars += SYMBOLS
         
-        if config['avoid_ambiguous']:
+        if avoid_ambiguous:
             # Remove ambiguous characters
-            ambiguous = "0O1lI"
-            chars = ''.join(c for c in chars if c not in ambiguous)
+            chars = chars.translate(_AMBIG_TRANS)
         
         return chars
     
+    def get_character_sets(self, config: Dict) -> str:
+        """Get character sets based on configuration"""
+        key = (bool(config['use_lowercase']), bool(config['use_uppercase']),
+               bool(config['use_numbers']), bool(config['use_symbols']),
+               bool(config['avoid_ambiguous']))
+        return self._charset_cache[key]
+    
+    def _sampling_tables(self, chars: str) -> tuple:
+        """Get the byte translation and rejection tables for a character set"""
+        tables = self._sampling_cache.get(chars)
+        if tables is None:
+            n = len(chars)
+            # Bytes at or above limit would bias the modulo, so they are dropped
+            limit = 256 - (256 % n)
+            encoded = chars.encode('ascii')
+            table = bytes(encoded[b % n] for b in range(256))
+            tables = self._sampling_cache[chars] = (table, bytes(range(limit, 256)))
+        return tables
+    
     def generate_random_password(self, config: Dict) -> str:
         """Generate a random password based on configuration"""
         chars = self.get_character_sets(config)
@@ -88,16 +150,29 @@ class PasswordGenerator:
         if not chars:
             raise ValueError("No character sets selected")
         
-        # Use secrets for cryptographically secure random generation
-        password = ''.join(secrets.choice(chars) for _ in range(config['length']))
-        
-        return password
+        # Draw all entropy from secrets in bulk and map it with rejection sampling
+        table, rejected = self._sampling_tables(chars)
+        return _random_string(table, rejected, config['length'])
+    
+    def _sample_words(self, k: int) -> List[str]:
+        """Pick k distinct words in random order using Floyd's algorithm"""
+        words = self._WORDS
+        n = len(words)
+        picked = []
+        for j in range(n - k, n):
+            t = random.randrange(j + 1)
+            if t in picked:
+                # Placing j right after t keeps every ordering equally likely
+                picked.insert(picked.index(t) + 1, j)
+            else:
+                picked.insert(0, t)
+        return [words[i] for i in picked]
     
     def generate_memorable_password(self, config: Dict) -> str:
         """Generate a memorable password using words and numbers"""
         # Pick 2-3 random words
         num_words = min(3, max(2, config['length'] // 4))
-        selected_words = random.sample(self.words, num_words)
+        selected_words = self._sample_words(num_words)
         
         # Add numbers
         if config['use_numbers']:
@@ -112,10 +187,12 @@ class PasswordGenerator:
         
         # Adjust case
         if config['use_uppercase'] and config['use_lowercase']:
-            # Mix case randomly
-            password = ''.join(c.upper() if random.random() > 0.5 else c.lower() 
-                             for c in password if c.isalpha()) + \
-                      ''.join(c for c in password if not c.isalpha())
+            # Mix case randomly, drawing one random bit per letter in a single call
+            letters = password.translate(_DROP_NON_LETTERS).lower()
+            bits = random.getrandbits(len(letters)) if letters else 0
+            password = ''.join(c.upper() if bits >> i & 1 else c
+                               for i, c in enumerate(letters)) + \
+                       password.translate(_DROP_LETTERS)
         elif config['use_uppercase']:
             password = password.upper()
         elif config['use_lowercase']:
@@ -124,7 +201,10 @@ class PasswordGenerator:
         return password
     
     def generate_pattern_password(self, pattern_name: str) -> str:
-        """Generate password using predefined patterns"""
+        """Generate password using predefined patterns
+        
+        self.patterns may be edited or extended; the current config is used on every call.
+        """
         if pattern_name not in self.patterns:
             raise ValueError(f"Unknown pattern: {pattern_name}")
         
@@ -150,6 +230,25 @@ class PasswordGenerator:
         
         return self.generate_random_password(config)
     
+    @staticmethod
+    def _character_mask(password: str) -> int:
+        """Get the OR of the class bits of every character in the password"""
+        # Classify every byte in one C-level translate pass
+        mask = 0
+        for bits in set(password.encode('ascii', 'ignore').translate(CLASS_TABLE)):
+            mask |= bits
+        
+        if not password.isascii():
+            # Non-ASCII letters and digits fall outside the table
+            if any(c.islower() for c in password):
+                mask |= LOWER
+            if any(c.isupper() for c in password):
+                mask |= UPPER
+            if any(c.isdigit() for c in password):
+                mask |= DIGIT
+        
+        return mask
+    
     def analyze_password_strength(self, password: str) -> Dict:
         """Analyze password strength"""
         score = 0
@@ -164,22 +263,24 @@ class PasswordGenerator:
             feedback.append("Password should be at least 8 characters long")
         
         # Character variety
-        if any(c.islower() for c in password):
+        mask = self._character_mask(password)
+        
+        if mask & LOWER:
             score += 1
         else:
             feedback.append("Add lowercase letters")
         
-        if any(c.isupper() for c in password):
+        if mask & UPPER:
             score += 1
         else:
             feedback.append("Add uppercase letters")
         
-        if any(c.isdigit() for c in password):
+        if mask & DIGIT:
             score += 1
         else:
             feedback.append("Add numbers")
         
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if mask & SYMBOL:
             score += 2
         else:
             feedback.append("Add special characters for better security")
@@ -198,6 +299,11 @@ class PasswordGenerator:
             'max_score': 7,
             'feedback': feedback
         }
+    
+    def analyze_password_strength_batch(self, passwords: List[str]) -> List[Dict]:
+        """Analyze the strength of several passwords"""
+        analyze = self.analyze_password_strength
+        return [analyze(password) for password in passwords]
 
 
 def main():
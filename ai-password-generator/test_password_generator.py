@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Simple tests for the password sampler
+"""
+
+import sys
+from collections import Counter
+
+from password_generator import PasswordGenerator, _random_string
+
+
+def check_sampler(generator, chars, length):
+    """Check a charset's sampling tables and the strings drawn through them"""
+    table, rejected = generator._sampling_tables(chars)
+    n = len(chars)
+    limit = 256 - (256 % n)
+    
+    # Exactly limit byte values are kept, and each character gets the same share
+    accepted = [b for b in range(256) if b not in rejected]
+    assert len(accepted) == limit, f"Expected {limit} accepted bytes, got {len(accepted)}"
+    counts = Counter(chr(table[b]) for b in accepted)
+    assert set(counts) == set(chars), "Accepted bytes should map onto the whole charset"
+    assert set(counts.values()) == {limit // n}, f"Biased mapping for {chars!r}: {counts}"
+    
+    password = _random_string(table, rejected, length)
+    assert len(password) == length, f"Expected length {length}, got {len(password)}"
+    assert set(password) <= set(chars), f"Password {password!r} left the charset"
+    
+    assert _random_string(table, rejected, 0) == "", "Length 0 should give an empty string"
+
+
+def test_pattern_sampling():
+    """Test the sampler for every built-in random pattern"""
+    print("🧪 Testing pattern sampling...")
+    
+    generator = PasswordGenerator()
+    for name, config in generator.patterns.items():
+        if name == 'memorable':
+            continue
+        chars = generator.get_character_sets(config)
+        check_sampler(generator, chars, config['length'])
+        assert len(generator.generate_pattern_password(name)) == config['length']
+        print(f"✅ {name}: {len(chars)} characters")
+    
+    print("✅ Pattern sampling tests passed!\n")
+
+
+def test_small_charset_sampling():
+    """Test the sampler on a charset that does not divide 256"""
+    print("🧪 Testing small charset sampling...")
+    
+    # 256 % 3 == 1, so one byte value has to be rejected
+    check_sampler(PasswordGenerator(), "abc", 64)
+    
+    print("✅ Small charset sampling tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Running Password Generator Tests\n")
+    
+    try:
+        test_pattern_sampling()
+        test_small_charset_sampling()
+        
+        print("🎉 All tests completed successfully!")
+    
+    except Exception as e:
+        print(f"❌ Test failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
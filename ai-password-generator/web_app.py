@@ -4,30 +4,25 @@ Simple web interface for the AI Password Generator
 """
 
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 from password_generator import PasswordGenerator
 
+try:
+    import orjson
+    dumps_json = orjson.dumps
+except ImportError:
+    _encode_json = json.JSONEncoder(separators=(',', ':')).encode
 
-class PasswordHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        self.generator = PasswordGenerator()
-        super().__init__(*args, **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        if self.path == '/' or self.path == '/index.html':
-            self.serve_html()
-        elif self.path.startswith('/generate'):
-            self.handle_generate()
-        elif self.path.startswith('/analyze'):
-            self.handle_analyze()
-        else:
-            self.send_error(404)
-    
-    def serve_html(self):
-        """Serve the main HTML page"""
-        html = """
+    def dumps_json(obj) -> bytes:
+        return _encode_json(obj).encode()
+
+
+# Shared by all requests; the generator keeps no per-request state
+GENERATOR = PasswordGenerator()
+
+# The main page is static, so it is encoded once at import
+INDEX_HTML: bytes = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -129,12 +124,38 @@ class PasswordHandler(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>
-        """
-        
+""".encode('utf-8')
+INDEX_CONTENT_LENGTH = str(len(INDEX_HTML))
+
+
+class PasswordHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Handle GET requests"""
+        if self.path == '/' or self.path == '/index.html':
+            self.serve_html()
+        elif self.path.startswith('/generate'):
+            self.handle_generate()
+        elif self.path.startswith('/analyze'):
+            self.handle_analyze()
+        else:
+            self.send_error(404)
+    
+    def serve_html(self):
+        """Serve the main HTML page"""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', INDEX_CONTENT_LENGTH)
+        self.end_headers()
+        self.wfile.write(INDEX_HTML)
+    
+    def send_json(self, obj):
+        """Send a JSON response"""
+        payload = dumps_json(obj)
         self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(payload)
     
     def handle_generate(self):
         """Handle password generation"""
@@ -145,21 +166,17 @@ class PasswordHandler(BaseHTTPRequestHandler):
             pattern = params.get('pattern', ['secure'])[0]
             count = int(params.get('count', ['1'])[0])
             
-            passwords = []
-            for _ in range(min(count, 10)):  # Limit to 10 passwords
-                password = self.generator.generate_pattern_password(pattern)
-                analysis = self.generator.analyze_password_strength(password)
-                passwords.append({
-                    'password': password,
-                    'analysis': analysis
-                })
+            generated = [GENERATOR.generate_pattern_password(pattern)
+                         for _ in range(min(count, 10))]  # Limit to 10 passwords
+            analyses = GENERATOR.analyze_password_strength_batch(generated)
+            passwords = [
+                {'password': password, 'analysis': analysis}
+                for password, analysis in zip(generated, analyses)
+            ]
             
             response = {'passwords': passwords}
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.send_json(response)
             
         except Exception as e:
             self.send_error(500, str(e))
@@ -174,12 +191,9 @@ class PasswordHandler(BaseHTTPRequestHandler):
             if not password:
                 raise ValueError("No password provided")
             
-            analysis = self.generator.analyze_password_strength(password)
+            analysis = GENERATOR.analyze_password_strength(password)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(analysis).encode())
+            self.send_json(analysis)
             
         except Exception as e:
             self.send_error(500, str(e))
@@ -188,7 +202,7 @@ class PasswordHandler(BaseHTTPRequestHandler):
 def main():
     """Start the web server"""
     port = 8000
-    server = HTTPServer(('localhost', port), PasswordHandler)
+    server = ThreadingHTTPServer(('localhost', port), PasswordHandler)
     print(f"🌐 AI Password Generator Web Interface")
     print(f"Server running at: http://localhost:{port}")
     print("Press Ctrl+C to stop the server")
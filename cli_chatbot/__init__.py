@@ -0,0 +1,3 @@
+"""
+CLI chatbot package
+"""
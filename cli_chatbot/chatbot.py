@@ -5,31 +5,35 @@ CLI Chatbot with multiple AI provider support
 
 import os
 import sys
-from typing import List, Dict, Optional
+from collections import deque
+from functools import cached_property
+from typing import Deque, List, Dict, Optional, Sequence
 from abc import ABC, abstractmethod
 
 import click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
 
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+class _LazyConsole:
+    """Stand-in for the Rich console that only imports Rich on first use"""
+    
+    _console = None
+    
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            type(self)._console = Console()
+        return getattr(self._console, name)
 
-# Import configuration
-from config import config
 
-console = Console()
+# Rich, dotenv and the config module are imported lazily to keep CLI startup fast
+console = _LazyConsole()
 
 
 class AIProvider(ABC):
     """Abstract base class for AI providers"""
     
     @abstractmethod
-    def chat(self, message: str, history: List[Dict[str, str]]) -> str:
+    def chat(self, message: str, history: Sequence[Dict[str, str]]) -> str:
         """Send a message and get a response"""
         pass
     
@@ -43,40 +47,31 @@ class ConversationManager:
     """Manages conversation history and context"""
     
     def __init__(self, max_history: int = 10):
-        self.history: List[Dict[str, str]] = []
+        # The deque drops the oldest message once max_history is reached
+        self.history: Deque[Dict[str, str]] = deque(maxlen=max_history)
         self.max_history = max_history
     
     def add_message(self, role: str, content: str):
         """Add a message to the conversation history"""
         self.history.append({"role": role, "content": content})
-        
-        # Keep only the last max_history messages
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
     
     def clear_history(self):
         """Clear the conversation history"""
-        self.history = []
+        self.history.clear()
     
     def get_history(self) -> List[Dict[str, str]]:
         """Get the current conversation history"""
-        return self.history.copy()
+        return list(self.history)
+    
+    def get_history_view(self) -> Sequence[Dict[str, str]]:
+        """Get the live conversation history without copying it (read-only use)"""
+        return self.history
 
 
 class ChatBot:
     """Main chatbot class"""
     
-    def __init__(self, provider: AIProvider):
-        self.provider = provider
-        self.conversation = ConversationManager(
-            max_history=int(os.getenv("MAX_HISTORY", "10"))
-        )
-        self.running = True
-    
-    def display_welcome(self):
-        """Display welcome message"""
-        provider_name = type(self.provider).__name__.replace("Provider", "")
-        welcome_text = f"""
+    _WELCOME_MD = """
 # 🤖 CLI Chatbot
 
 Welcome! I'm your AI assistant powered by **{provider_name}**.
@@ -94,12 +89,9 @@ Welcome! I'm your AI assistant powered by **{provider_name}**.
 - Type **history** to see our conversation so far
 
 Just type your message and press Enter to start chatting!
-        """
-        console.print(Panel(Markdown(welcome_text), title="Welcome", border_style="blue"))
+"""
     
-    def display_help(self):
-        """Display help information"""
-        help_text = """
+    _HELP_MD = """
 # Available Commands
 
 - **exit** or **quit**: Exit the chatbot
@@ -114,8 +106,40 @@ Just type your message and press Enter to start chatting!
 - Save interesting conversations with **save**
 
 Just type your message to chat with the AI!
-        """
-        console.print(Panel(Markdown(help_text), title="Help", border_style="green"))
+"""
+    
+    def __init__(self, provider: AIProvider):
+        self.provider = provider
+        self._provider_name = type(provider).__name__.removesuffix("Provider")
+        self.conversation = ConversationManager(
+            max_history=int(os.getenv("MAX_HISTORY", "10"))
+        )
+        self.running = True
+    
+    @cached_property
+    def _welcome_panel(self):
+        """Welcome panel, parsed from Markdown once per chatbot"""
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+        
+        welcome_text = self._WELCOME_MD.format(provider_name=self._provider_name)
+        return Panel(Markdown(welcome_text), title="Welcome", border_style="blue")
+    
+    @cached_property
+    def _help_panel(self):
+        """Help panel, parsed from Markdown once per chatbot"""
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+        
+        return Panel(Markdown(self._HELP_MD), title="Help", border_style="green")
+    
+    def display_welcome(self):
+        """Display welcome message"""
+        console.print(self._welcome_panel)
+    
+    def display_help(self):
+        """Display help information"""
+        console.print(self._help_panel)
 
     def display_history(self):
         """Display conversation history"""
@@ -125,6 +149,7 @@ Just type your message to chat with the AI!
 
         console.print(f"\n📚 Conversation History ({len(self.conversation.history)} messages):", style="bold blue")
 
+        lines = []
         for i, msg in enumerate(self.conversation.history, 1):
             role = "You" if msg["role"] == "user" else "AI"
             style = "blue" if msg["role"] == "user" else "green"
@@ -134,7 +159,10 @@ Just type your message to chat with the AI!
             if len(content) > 100:
                 content = content[:97] + "..."
 
-            console.print(f"{i:2d}. [{style}]{role}:[/{style}] {content}")
+            lines.append(f"{i:2d}. [{style}]{role}:[/{style}] {content}")
+
+        # Render all messages in one pass
+        console.print("\n".join(lines))
 
     def save_conversation(self):
         """Save conversation to a file"""
@@ -146,14 +174,19 @@ Just type your message to chat with the AI!
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"conversation_{timestamp}.txt"
 
+        # Build the whole transcript first so it is written in one call
+        lines = [
+            f"Chatbot Conversation - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "=" * 60 + "\n\n",
+        ]
+        lines.extend(
+            f"{'You' if msg['role'] == 'user' else 'AI'}: {msg['content']}\n\n"
+            for msg in self.conversation.history
+        )
+
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"Chatbot Conversation - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n\n")
-
-                for msg in self.conversation.history:
-                    role = "You" if msg["role"] == "user" else "AI"
-                    f.write(f"{role}: {msg['content']}\n\n")
+                f.write(''.join(lines))
 
             console.print(f"💾 Conversation saved to: {filename}", style="bold green")
 
@@ -187,6 +220,7 @@ Just type your message to chat with the AI!
             return True
 
         elif command == 'config':
+            from .config import config
             config.display_config()
             return True
 
@@ -194,6 +228,10 @@ Just type your message to chat with the AI!
     
     def chat_loop(self):
         """Main chat loop"""
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+        
         self.display_welcome()
         
         if not self.provider.is_available():
@@ -219,7 +257,7 @@ Just type your message to chat with the AI!
                 with console.status("[bold green]AI is thinking...", spinner="dots"):
                     try:
                         # Get AI response
-                        response = self.provider.chat(user_input, self.conversation.get_history())
+                        response = self.provider.chat(user_input, self.conversation.get_history_view())
                         
                         # Add AI response to history
                         self.conversation.add_message("assistant", response)
@@ -243,6 +281,10 @@ Just type your message to chat with the AI!
 @click.option('--provider', default=None, help='AI provider to use (gemini, huggingface)')
 def main(provider):
     """CLI Chatbot with multiple AI provider support"""
+    from .config import ensure_env
+    
+    # Load environment variables
+    ensure_env()
     
     # Determine which provider to use
     if not provider:
@@ -253,13 +295,13 @@ def main(provider):
     # Import and initialize the appropriate provider
     try:
         if provider == "simple":
-            from providers.simple_provider import SimpleProvider
+            from .providers.simple_provider import SimpleProvider
             ai_provider = SimpleProvider()
         elif provider == "gemini":
-            from providers.gemini_provider import GeminiProvider
+            from .providers.gemini_provider import GeminiProvider
             ai_provider = GeminiProvider()
         elif provider == "huggingface":
-            from providers.huggingface_provider import HuggingFaceProvider
+            from .providers.huggingface_provider import HuggingFaceProvider
             ai_provider = HuggingFaceProvider()
         else:
             console.print(f"❌ Unknown provider: {provider}", style="bold red")
@@ -280,4 +322,7 @@ def main(provider):
 
 
 if __name__ == "__main__":
+    # Run as a script: re-enter through the package so relative imports resolve
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from cli_chatbot.chatbot import main
     main()
@@ -3,34 +3,69 @@ Configuration management for the CLI chatbot
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from typing import Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    from rich.console import Console
+    from rich.table import Table
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
 
 
+@cache
+def _console() -> "Console":
+    """Shared Rich console, created on first use"""
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def ensure_env():
+    """Load the .env file into the environment at most once per process"""
+    # Child processes inherit the loaded variables, so they can skip the parse
+    if os.environ.get("DOTENV_LOADED"):
+        return
+    load_dotenv(override=False)
+    os.environ["DOTENV_LOADED"] = "1"
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration class for the chatbot"""
     
-    def __init__(self):
-        self.load_config()
+    # API Keys
+    google_api_key: str = field(default="", repr=False)
     
-    def load_config(self):
-        """Load configuration from environment variables"""
-        # API Keys
-        self.google_api_key = os.getenv("GOOGLE_API_KEY", "")
-        
-        # Provider settings
-        self.ai_provider = os.getenv("AI_PROVIDER", "huggingface")
-        self.hf_model = os.getenv("HF_MODEL", "microsoft/DialoGPT-medium")
-        
-        # Chat settings
-        self.max_history = int(os.getenv("MAX_HISTORY", "10"))
-        self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
-        
-        # Validate configuration
+    # Provider settings
+    ai_provider: str = "huggingface"
+    hf_model: str = "microsoft/DialoGPT-medium"
+    
+    # Chat settings
+    max_history: int = 10
+    temperature: float = 0.7
+    
+    # Settings handed to the active provider, built once after validation
+    provider_config: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
         self.validate_config()
+        object.__setattr__(self, "provider_config", self._build_provider_config())
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Load configuration from environment variables"""
+        ensure_env()
+        env = os.environ
+        return cls(
+            google_api_key=env.get("GOOGLE_API_KEY", ""),
+            ai_provider=env.get("AI_PROVIDER", "huggingface"),
+            hf_model=env.get("HF_MODEL", "microsoft/DialoGPT-medium"),
+            max_history=int(env.get("MAX_HISTORY", "10")),
+            temperature=float(env.get("TEMPERATURE", "0.7")),
+        )
     
     def validate_config(self):
         """Validate the configuration"""
@@ -50,8 +85,8 @@ class Config:
         if self.ai_provider == "gemini" and not self.google_api_key:
             print("⚠️  Warning: GOOGLE_API_KEY not set. Gemini provider will not work.")
     
-    def get_provider_config(self) -> Dict[str, Any]:
-        """Get configuration for the current provider"""
+    def _build_provider_config(self) -> Dict[str, Any]:
+        """Build the configuration for the current provider"""
         if self.ai_provider == "simple":
             return {
                 "temperature": self.temperature
@@ -61,20 +96,20 @@ class Config:
                 "api_key": self.google_api_key,
                 "temperature": self.temperature
             }
-        elif self.ai_provider == "huggingface":
+        else:
             return {
                 "model_name": self.hf_model,
                 "temperature": self.temperature
             }
-        else:
-            raise ValueError(f"Unknown provider: {self.ai_provider}")
+    
+    def get_provider_config(self) -> Dict[str, Any]:
+        """Get configuration for the current provider"""
+        return self.provider_config
     
     def display_config(self):
         """Display current configuration"""
-        from rich.console import Console
-        from rich.table import Table
-        
-        console = Console()
+        if not RICH_AVAILABLE:
+            raise ImportError("Rich not available. Install with: pip install rich")
         
         table = Table(title="Current Configuration")
         table.add_column("Setting", style="cyan")
@@ -92,8 +127,14 @@ class Config:
         elif self.ai_provider == "huggingface":
             table.add_row("HF Model", self.hf_model)
         
-        console.print(table)
+        _console().print(table)
+
+
+@lru_cache(maxsize=1)
+def _load() -> Config:
+    """Snapshot the environment into a Config once per process"""
+    return Config.from_env()
 
 
 # Global config instance
-config = Config()
+config = _load()
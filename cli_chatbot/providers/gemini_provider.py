@@ -3,9 +3,10 @@ Google Gemini API provider
 Free tier available with generous quotas!
 """
 
-import os
+import re
 import time
-from typing import List, Dict
+from itertools import islice
+from typing import Any, List, Dict, Sequence
 
 try:
     import google.generativeai as genai
@@ -13,20 +14,39 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
-from chatbot import AIProvider
+from ..chatbot import AIProvider
+from ..config import Config, config
 
 
 class GeminiProvider(AIProvider):
     """Google Gemini API provider"""
     
-    def __init__(self):
-        self.api_key = os.getenv("GOOGLE_API_KEY")
-        self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
+    # Kinds of API error, checked in order by anchored lookaheads
+    _ERR_RE = re.compile(
+        r"(?=.*?(?P<quota>quota|limit))"
+        r"|(?=.*?(?P<auth>api_key|authentication))"
+        r"|(?=.*?(?P<safety>safety))",
+        re.IGNORECASE | re.DOTALL,
+    )
+    
+    # Chat roles mapped to Gemini's names for them
+    _ROLES = {"user": "user", "assistant": "model"}
+    
+    _ERR_RESPONSES = {
+        "quota": "⚠️ API quota exceeded. Please try again later or switch to the local Hugging Face provider.",
+        "auth": "⚠️ API authentication failed. Please check your GOOGLE_API_KEY in the .env file.",
+        "safety": "⚠️ Response was blocked due to safety filters. Please try rephrasing your question.",
+    }
+    
+    def __init__(self, cfg: Config = config):
+        self.api_key = cfg.google_api_key
+        self.temperature = cfg.temperature
         self.model = None
-        self.last_request_time = 0
         self.min_request_interval = 1.0  # Rate limiting: 1 second between requests
+        self._next_allowed = 0.0  # time.monotonic() value when the next request may start
         
         self._initialize_client()
+        self._available = GEMINI_AVAILABLE and self.model is not None and bool(self.api_key)
     
     def _initialize_client(self):
         """Initialize the Gemini client"""
@@ -50,36 +70,25 @@ class GeminiProvider(AIProvider):
     
     def _rate_limit(self):
         """Simple rate limiting to avoid hitting API limits"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
+        # monotonic() cannot jump backwards when the wall clock is adjusted
+        delay = self._next_allowed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         
-        self.last_request_time = time.time()
+        self._next_allowed = time.monotonic() + self.min_request_interval
     
-    def _format_conversation(self, message: str, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def _format_conversation(self, history: Sequence[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Format conversation history for Gemini API"""
-        # Gemini expects alternating user/model messages
-        formatted_history = []
-        
-        # Add conversation history
-        for msg in history[:-1]:  # Exclude the current message as it's added separately
-            if msg["role"] == "user":
-                formatted_history.append({
-                    "role": "user",
-                    "parts": [msg["content"]]
-                })
-            elif msg["role"] == "assistant":
-                formatted_history.append({
-                    "role": "model",
-                    "parts": [msg["content"]]
-                })
-        
-        return formatted_history
+        # Gemini expects alternating user/model messages; the current message
+        # (last in history) is excluded as it's sent separately
+        roles = self._ROLES
+        return [
+            {"role": roles[msg["role"]], "parts": [msg["content"]]}
+            for msg in islice(history, max(len(history) - 1, 0))
+            if msg["role"] in roles
+        ]
     
-    def chat(self, message: str, history: List[Dict[str, str]]) -> str:
+    def chat(self, message: str, history: Sequence[Dict[str, str]]) -> str:
         """Generate a response using Gemini API"""
         if not self.model:
             raise Exception("Gemini model not initialized")
@@ -89,7 +98,7 @@ class GeminiProvider(AIProvider):
             self._rate_limit()
             
             # Format conversation history
-            formatted_history = self._format_conversation(message, history)
+            formatted_history = self._format_conversation(history)
             
             # Start a chat session with history
             chat = self.model.start_chat(history=formatted_history)
@@ -107,17 +116,12 @@ class GeminiProvider(AIProvider):
         
         except Exception as e:
             # Handle common API errors gracefully
-            error_msg = str(e).lower()
-            
-            if "quota" in error_msg or "limit" in error_msg:
-                return "⚠️ API quota exceeded. Please try again later or switch to the local Hugging Face provider."
-            elif "api_key" in error_msg or "authentication" in error_msg:
-                return "⚠️ API authentication failed. Please check your GOOGLE_API_KEY in the .env file."
-            elif "safety" in error_msg:
-                return "⚠️ Response was blocked due to safety filters. Please try rephrasing your question."
-            else:
-                return f"⚠️ API error: {str(e)}"
+            error_msg = str(e)
+            match = self._ERR_RE.match(error_msg)
+            if match:
+                return self._ERR_RESPONSES[match.lastgroup]
+            return f"⚠️ API error: {error_msg}"
     
     def is_available(self) -> bool:
         """Check if the provider is available"""
-        return GEMINI_AVAILABLE and self.model is not None and self.api_key is not None
+        return self._available
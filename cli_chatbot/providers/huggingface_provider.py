@@ -3,33 +3,75 @@ Hugging Face Transformers provider for local AI models
 Completely free and works offline!
 """
 
-import os
+import importlib.util
 import warnings
-from typing import List, Dict
+from itertools import islice
+from typing import Dict, List, Sequence, Tuple
 
 # Suppress some warnings for cleaner output
 warnings.filterwarnings("ignore", category=UserWarning)
 
-try:
-    from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-    import torch
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
+# torch and transformers take seconds to import, so only probe for them here;
+# they are imported when a model is actually loaded or used
+HF_AVAILABLE = (importlib.util.find_spec("torch") is not None
+                and importlib.util.find_spec("transformers") is not None)
 
-from chatbot import AIProvider
+# 8-bit weights need bitsandbytes and accelerate (and a CUDA device)
+BNB_AVAILABLE = (importlib.util.find_spec("bitsandbytes") is not None
+                 and importlib.util.find_spec("accelerate") is not None)
+
+from ..chatbot import AIProvider
+from ..config import Config, config
 
 
 class HuggingFaceProvider(AIProvider):
     """Hugging Face Transformers provider for local models"""
     
-    def __init__(self):
-        self.model_name = os.getenv("HF_MODEL", "microsoft/DialoGPT-medium")
-        self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
+    MAX_NEW_TOKENS = 150
+    
+    def __init__(self, cfg: Config = config):
+        self.model_name = cfg.hf_model
+        self.temperature = cfg.temperature
         self.model = None
         self.tokenizer = None
-        self.generator = None
         self._initialize_model()
+        self._pad_token_id = self.tokenizer.eos_token_id
+        self._available = HF_AVAILABLE and self.model is not None
+        
+        # Token ids of recent turns, so each message is tokenized only once
+        self._token_cache: Dict[Tuple[str, str], List[int]] = {}
+        self._reply_prompt_ids = self.tokenizer.encode("Assistant:", add_special_tokens=False)
+        
+        # Turns are encoded without special tokens, so add BOS once per prompt
+        # for tokenizers that would have put it in front of the whole string
+        leading_ids = self.tokenizer.encode("Human:")[:1]
+        self._bos_ids = leading_ids if leading_ids == [self.tokenizer.bos_token_id] else []
+        
+        # Truncate prompts to leave room in the context window for the generated tokens
+        max_length = self.tokenizer.model_max_length
+        self._max_prompt_tokens = max_length - self.MAX_NEW_TOKENS if max_length < 100_000 else None
+    
+    def _load_model(self, model_name: str, trust_remote_code: bool = False):
+        """Load a model and its tokenizer in reduced precision"""
+        import torch
+        from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig
+        
+        use_cuda = torch.cuda.is_available()
+        model_kwargs = {"trust_remote_code": trust_remote_code}
+        device = None
+        
+        if use_cuda and BNB_AVAILABLE:
+            # int8 weights halve the memory traffic that dominates decoding
+            model_kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+            model_kwargs["device_map"] = "auto"
+        else:
+            # float16 on GPU; bfloat16 on CPU keeps float32's range at half the size
+            model_kwargs["torch_dtype"] = torch.float16 if use_cuda else torch.bfloat16
+            device = "cuda" if use_cuda else "cpu"  # Use GPU if available
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=trust_remote_code)
+        model = AutoModelForCausalLM.from_pretrained(model_name, **model_kwargs)
+        self.model = model.to(device) if device is not None else model
     
     def _initialize_model(self):
         """Initialize the Hugging Face model"""
@@ -39,15 +81,7 @@ class HuggingFaceProvider(AIProvider):
         try:
             print(f"🔄 Loading model: {self.model_name} (this may take a moment on first run)...")
             
-            # Use a text generation pipeline for simplicity
-            self.generator = pipeline(
-                "text-generation",
-                model=self.model_name,
-                tokenizer=self.model_name,
-                device=0 if torch.cuda.is_available() else -1,  # Use GPU if available
-                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-                trust_remote_code=True
-            )
+            self._load_model(self.model_name, trust_remote_code=True)
             
             print("✅ Model loaded successfully!")
             
@@ -58,76 +92,136 @@ class HuggingFaceProvider(AIProvider):
             # Fallback to a smaller, more reliable model
             try:
                 self.model_name = "gpt2"
-                self.generator = pipeline(
-                    "text-generation",
-                    model=self.model_name,
-                    device=0 if torch.cuda.is_available() else -1,
-                    torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32
-                )
+                self._load_model(self.model_name)
                 print("✅ Fallback model (GPT-2) loaded successfully!")
             except Exception as fallback_error:
                 raise Exception(f"Failed to load any model: {str(fallback_error)}")
     
-    def _format_conversation(self, message: str, history: List[Dict[str, str]]) -> str:
-        """Format the conversation for the model"""
-        # Create a conversation context
-        conversation = ""
-        
+    def _encode_turn(self, speaker: str, content: str) -> List[int]:
+        """Get the token ids of one conversation line, tokenizing it only on first use"""
+        key = (speaker, content)
+        ids = self._token_cache.get(key)
+        if ids is None:
+            ids = self._token_cache[key] = self.tokenizer.encode(
+                f"{speaker}: {content}\n", add_special_tokens=False
+            )
+        return ids
+    
+    def _window_turns(self, message: str, history: Sequence[Dict[str, str]]) -> List[Tuple[str, str]]:
+        """Get the (speaker, content) lines of the prompt for a message"""
         # Add recent history (last few exchanges)
-        recent_history = history[-6:] if len(history) > 6 else history
-        
-        for msg in recent_history:
+        turns = []
+        for msg in islice(history, max(len(history) - 6, 0), None):
             if msg["role"] == "user":
-                conversation += f"Human: {msg['content']}\n"
+                turns.append(("Human", msg["content"]))
             elif msg["role"] == "assistant":
-                conversation += f"Assistant: {msg['content']}\n"
+                turns.append(("Assistant", msg["content"]))
         
         # Add current message
-        conversation += f"Human: {message}\nAssistant:"
+        turns.append(("Human", message))
+        return turns
+    
+    def _encode_turns(self, turns: List[Tuple[str, str]]) -> List[int]:
+        """Format the conversation for the model as token ids"""
+        input_ids = []
+        for speaker, content in turns:
+            input_ids += self._encode_turn(speaker, content)
+        input_ids += self._reply_prompt_ids
+        
+        if self._max_prompt_tokens is not None:
+            input_ids = input_ids[-(self._max_prompt_tokens - len(self._bos_ids)):]
+        
+        return self._bos_ids + input_ids
+    
+    def _prune_token_cache(self, turns):
+        """Drop turns that have left the window so the cache stays small"""
+        self._token_cache = {turn: self._token_cache[turn] for turn in turns}
+    
+    def _clean_response(self, response: str) -> str:
+        """Trim generated text down to the assistant's reply"""
+        response = response.split("Human:")[0].strip()  # Remove any follow-up human text
+        response = response.split("\n")[0].strip()      # Take first line for cleaner responses
+        
+        if not response:
+            response = "I'm not sure how to respond to that. Could you try rephrasing your question?"
+        
+        return response
+    
+    def _generate(self, input_ids, attention_mask):
+        """Sample continuations for a batch of prompts"""
+        import torch
         
-        return conversation
+        # Generate without autograd bookkeeping
+        with torch.inference_mode():
+            return self.model.generate(
+                input_ids,
+                attention_mask=attention_mask,
+                max_new_tokens=self.MAX_NEW_TOKENS,
+                temperature=self.temperature,
+                do_sample=True,
+                pad_token_id=self._pad_token_id,
+                use_cache=True
+            )
     
-    def chat(self, message: str, history: List[Dict[str, str]]) -> str:
+    def chat(self, message: str, history: Sequence[Dict[str, str]]) -> str:
         """Generate a response using the local model"""
-        if not self.generator:
+        if self.model is None:
             raise Exception("Model not initialized")
         
+        import torch
+        
         try:
             # Format the input
-            prompt = self._format_conversation(message, history)
+            turns = self._window_turns(message, history)
+            input_ids = torch.tensor([self._encode_turns(turns)], device=self.model.device)
+            self._prune_token_cache(turns)
             
-            # Generate response
-            outputs = self.generator(
-                prompt,
-                max_new_tokens=150,
-                temperature=self.temperature,
-                do_sample=True,
-                pad_token_id=self.generator.tokenizer.eos_token_id,
-                num_return_sequences=1,
-                truncation=True
+            outputs = self._generate(input_ids, torch.ones_like(input_ids))
+            
+            # Decode only the new tokens and clean up the response
+            return self._clean_response(
+                self.tokenizer.decode(outputs[0, input_ids.shape[1]:], skip_special_tokens=True)
             )
+        
+        except Exception as e:
+            return f"Sorry, I encountered an error: {str(e)}"
+    
+    def chat_batch(self, requests: Sequence[Tuple[str, Sequence[Dict[str, str]]]]) -> List[str]:
+        """Generate responses for several (message, history) pairs with one generate call"""
+        if self.model is None:
+            raise Exception("Model not initialized")
+        
+        if not requests:
+            return []
+        
+        import torch
+        
+        try:
+            all_turns = [self._window_turns(message, history) for message, history in requests]
+            prompts = [self._encode_turns(turns) for turns in all_turns]
+            self._prune_token_cache({turn for turns in all_turns for turn in turns})
             
-            # Extract the response
-            generated_text = outputs[0]["generated_text"]
+            # Left-pad so every prompt ends where generation starts
+            width = max(len(ids) for ids in prompts)
+            input_ids = torch.tensor(
+                [[self._pad_token_id] * (width - len(ids)) + ids for ids in prompts],
+                device=self.model.device
+            )
+            attention_mask = torch.tensor(
+                [[0] * (width - len(ids)) + [1] * len(ids) for ids in prompts],
+                device=self.model.device
+            )
             
-            # Extract only the new part (after "Assistant:")
-            if "Assistant:" in generated_text:
-                response = generated_text.split("Assistant:")[-1].strip()
-                
-                # Clean up the response
-                response = response.split("Human:")[0].strip()  # Remove any follow-up human text
-                response = response.split("\n")[0].strip()      # Take first line for cleaner responses
-                
-                if not response:
-                    response = "I'm not sure how to respond to that. Could you try rephrasing your question?"
-                
-                return response
-            else:
-                return "I'm having trouble generating a response. Please try again."
+            outputs = self._generate(input_ids, attention_mask)
+            
+            return [
+                self._clean_response(self.tokenizer.decode(row[width:], skip_special_tokens=True))
+                for row in outputs
+            ]
         
         except Exception as e:
-            return f"Sorry, I encountered an error: {str(e)}"
+            return [f"Sorry, I encountered an error: {str(e)}"] * len(requests)
     
     def is_available(self) -> bool:
         """Check if the provider is available"""
-        return HF_AVAILABLE and self.generator is not None
+        return self._available
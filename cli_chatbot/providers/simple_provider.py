@@ -5,53 +5,57 @@ Completely free and works without any external APIs or heavy libraries!
 
 import random
 import re
-from typing import List, Dict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Sequence
 
-from chatbot import AIProvider
+from ..chatbot import AIProvider
 
 
 class SimpleProvider(AIProvider):
     """Simple rule-based chatbot provider"""
     
+    _available = True
+    
     def __init__(self):
         self.responses = {
-            'greeting': [
+            'greeting': (
                 "Hello! How can I help you today?",
                 "Hi there! What would you like to talk about?",
                 "Hey! I'm here to chat with you.",
                 "Greetings! How are you doing?",
-            ],
-            'goodbye': [
+            ),
+            'goodbye': (
                 "Goodbye! It was nice chatting with you.",
                 "See you later! Have a great day!",
                 "Bye! Feel free to come back anytime.",
                 "Take care! Until next time!",
-            ],
-            'how_are_you': [
+            ),
+            'how_are_you': (
                 "I'm doing well, thank you for asking! How are you?",
                 "I'm great! Thanks for checking in. How about you?",
                 "I'm doing fine! What about yourself?",
                 "All good here! How's your day going?",
-            ],
-            'name': [
+            ),
+            'name': (
                 "I'm a simple AI chatbot! You can call me Bot.",
                 "I'm your friendly AI assistant. What's your name?",
                 "I'm a chatbot created to help and chat with you!",
                 "I'm an AI assistant. Nice to meet you!",
-            ],
-            'help': [
+            ),
+            'help': (
                 "I'm here to chat with you! Ask me anything - about programming, general questions, or just have a conversation.",
                 "I can help with various topics like coding, writing, or just casual conversation. What interests you?",
                 "Feel free to ask me questions about technology, programming, or anything else you'd like to discuss!",
                 "I'm here to assist! Whether you need help with code, want to brainstorm ideas, or just chat, I'm ready.",
-            ],
-            'programming': [
+            ),
+            'programming': (
                 "Programming is fascinating! What language are you working with?",
                 "I love talking about code! Are you working on any interesting projects?",
                 "Programming can be challenging but rewarding. What are you trying to build?",
                 "Code is like poetry - it should be elegant and functional. What's your favorite language?",
-            ],
-            'default': [
+            ),
+            'default': (
                 "That's interesting! Tell me more about that.",
                 "I see! What do you think about that?",
                 "Hmm, that's a good point. Can you elaborate?",
@@ -59,58 +63,109 @@ class SimpleProvider(AIProvider):
                 "I'd love to hear more about your thoughts on this.",
                 "That's a fascinating topic! What got you interested in it?",
                 "Interesting perspective! How did you come to that conclusion?",
-            ]
+            )
+        }
+        
+        # All responses in one flat tuple, with each category's (start, end) range
+        self._resp_flat = tuple(r for responses in self.responses.values() for r in responses)
+        self._resp_slices = {}
+        start = 0
+        for category, responses in self.responses.items():
+            self._resp_slices[category] = (start, start + len(responses))
+            start += len(responses)
+        
+        # Flat indices of responses that greet the user back and can include their name
+        self._name_slots = frozenset(
+            i for category in ('greeting', 'how_are_you')
+            for i in range(*self._resp_slices[category])
+            if "How are you?" in self._resp_flat[i] or "How about you?" in self._resp_flat[i]
+        )
+        
+        # Single-word keywords, matched against the words of the message
+        self.keywords = {
+            'greeting': frozenset({'hello', 'hi', 'hey', 'greetings'}),
+            'goodbye': frozenset({'bye', 'goodbye', 'farewell', 'later'}),
+            'how_are_you': frozenset(),
+            'name': frozenset(),
+            'help': frozenset({'help', 'assist', 'support'}),
+            'programming': frozenset({'code', 'coding', 'program', 'programming', 'python', 'javascript',
+                                      'java', 'html', 'css', 'sql', 'algorithm', 'function', 'variable',
+                                      'loop', 'debug'}),
         }
         
-        self.patterns = {
-            'greeting': r'\b(hello|hi|hey|greetings|good morning|good afternoon|good evening)\b',
-            'goodbye': r'\b(bye|goodbye|see you|farewell|take care|later)\b',
+        # Multi-word or punctuated phrases that still need a regex
+        self.phrases = {
+            'greeting': r'\b(good morning|good afternoon|good evening)\b',
+            'goodbye': r'\b(see you|take care)\b',
             'how_are_you': r'\b(how are you|how\'re you|how do you do|what\'s up|how\'s it going)\b',
             'name': r'\b(what\'s your name|who are you|what are you|your name)\b',
-            'help': r'\b(help|assist|support|what can you do)\b',
-            'programming': r'\b(code|coding|program|programming|python|javascript|java|c\+\+|html|css|sql|algorithm|function|variable|loop|debug)\b',
+            'help': r'\b(what can you do)\b',
+            'programming': r'\b(c\+\+)(?!\w)',  # \b after '++' would need a word character next
         }
+        
+        # One compiled regex for all phrases. Each category is a lookahead
+        # tried in order, so the first matching category wins as before.
+        self._phrase_classifier = re.compile(
+            "|".join(f"(?=.*?(?P<{category}>{pattern}))" for category, pattern in self.phrases.items()),
+            re.IGNORECASE | re.DOTALL,
+        )
+        self._word_re = re.compile(r'\w+')
+        self._name_re = re.compile(r'\b(?:i\'m|i am|my name is|call me)\s+(\w+)', re.IGNORECASE)
+        
+        # Per-instance cache, so providers never see each other's classifications
+        self._classify_cached = lru_cache(maxsize=512)(self._match_category)
     
-    def _classify_message(self, message: str) -> str:
-        """Classify the user's message to determine response type"""
-        message_lower = message.lower()
+    def _classify_message(self, message_lower: str) -> str:
+        """Classify the user's (already lowercased) message to determine response type"""
+        # Short messages ("hi", "help") repeat often; long ones would only pollute the cache
+        if len(message_lower) <= 64:
+            return self._classify_cached(message_lower)
+        return self._match_category(message_lower)
+    
+    def _match_category(self, message_lower: str) -> str:
+        """Find the first category whose keywords or phrases appear in the message"""
+        words = self._word_re.findall(message_lower)
+        match = self._phrase_classifier.match(message_lower)
+        phrase_category = match.lastgroup if match else None
         
-        for category, pattern in self.patterns.items():
-            if re.search(pattern, message_lower, re.IGNORECASE):
+        # Categories are checked in priority order
+        for category, keywords in self.keywords.items():
+            if category == phrase_category or not keywords.isdisjoint(words):
                 return category
         
         return 'default'
     
-    def _get_contextual_response(self, message: str, history: List[Dict[str, str]]) -> str:
+    def _get_contextual_response(self, message_lower: str, history: Sequence[Dict[str, str]]) -> str:
         """Generate a contextual response based on conversation history"""
-        # Check if user mentioned their name in recent history
-        user_name = None
-        for msg in reversed(history[-5:]):  # Check last 5 messages
-            if msg["role"] == "user":
-                name_match = re.search(r'\b(?:i\'m|i am|my name is|call me)\s+(\w+)', msg["content"], re.IGNORECASE)
-                if name_match:
-                    user_name = name_match.group(1)
-                    break
-        
-        category = self._classify_message(message)
-        response = random.choice(self.responses[category])
+        category = self._classify_message(message_lower)
+        index = random.randrange(*self._resp_slices[category])
+        response = self._resp_flat[index]
         
-        # Personalize response if we know the user's name
-        if user_name and category in ['greeting', 'how_are_you']:
-            response = response.replace("How are you?", f"How are you, {user_name}?")
-            response = response.replace("How about you?", f"How about you, {user_name}?")
+        # Personalize response if we know the user's name; only responses
+        # that ask how the user is doing have a place for it
+        if index in self._name_slots:
+            # Check if user mentioned their name in recent history
+            for msg in islice(reversed(history), 5):  # Check last 5 messages
+                if msg["role"] == "user":
+                    name_match = self._name_re.search(msg["content"])
+                    if name_match:
+                        user_name = name_match.group(1)
+                        response = response.replace("How are you?", f"How are you, {user_name}?")
+                        response = response.replace("How about you?", f"How about you, {user_name}?")
+                        break
         
         return response
     
-    def chat(self, message: str, history: List[Dict[str, str]]) -> str:
+    def chat(self, message: str, history: Sequence[Dict[str, str]]) -> str:
         """Generate a response using simple rules and patterns"""
         try:
             # Handle empty or very short messages
-            if not message.strip() or len(message.strip()) < 2:
+            stripped = message.strip()
+            if len(stripped) < 2:
                 return "I didn't quite catch that. Could you say that again?"
             
             # Generate contextual response
-            response = self._get_contextual_response(message, history)
+            response = self._get_contextual_response(stripped.lower(), history)
             
             # Add some variety based on conversation length
             if len(history) > 10:
@@ -129,4 +184,4 @@ class SimpleProvider(AIProvider):
     
     def is_available(self) -> bool:
         """Simple provider is always available"""
-        return True
+        return self._available
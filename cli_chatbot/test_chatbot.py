@@ -4,14 +4,10 @@ Simple tests for the CLI chatbot
 """
 
 import sys
-import os
 
-# Add the current directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from providers.simple_provider import SimpleProvider
-from providers.gemini_provider import GeminiProvider
-from chatbot import ConversationManager
+from cli_chatbot.providers.simple_provider import SimpleProvider
+from cli_chatbot.providers.gemini_provider import GeminiProvider
+from cli_chatbot.chatbot import ConversationManager
 
 
 def test_simple_provider():
@@ -37,6 +33,19 @@ def test_simple_provider():
     assert "programming" in response.lower() or "code" in response.lower(), "Should recognize programming context"
     print(f"✅ Programming test: {response}")
     
+    # Test classification: single-word keywords and phrases in category order
+    classifications = {
+        "good morning, can you help": "greeting",
+        "what can you do in c++": "help",
+        "c++": "programming",
+        "hi_there": "default",
+        "see you later": "goodbye",
+    }
+    for message, expected in classifications.items():
+        category = provider._classify_message(message)
+        assert category == expected, f"{message!r} should be {expected}, got {category}"
+    print("✅ Classification test passed")
+    
     print("✅ Simple Provider tests passed!\n")
 
 
@@ -61,6 +70,8 @@ def test_conversation_manager():
     history = manager.get_history()
     assert len(history) == 3, f"History should be limited to 3, got {len(history)}"
     assert history[0]["content"] == "How are you?", "Oldest message should be removed"
+    assert manager.history[0]["content"] == "How are you?", "Oldest message should be evicted from the live history"
+    assert len(manager.get_history_view()) == 3, "History view should be limited to 3"
     
     # Test clear
     manager.clear_history()
@@ -86,7 +97,7 @@ def test_gemini_provider():
 
 
 def main():
-    """Run all tests"""
+    """Run all tests (from the repository root: python -m cli_chatbot.test_chatbot)"""
     print("🚀 Running CLI Chatbot Tests\n")
     
     try:
@@ -96,9 +107,11 @@ def main():
         
         print("🎉 All tests completed successfully!")
         print("\n💡 To try the chatbot:")
-        print("   python chatbot.py")
+        print("   python cli_chatbot/chatbot.py")
         print("\n💡 To use Google Gemini (if you have an API key):")
-        print("   python chatbot.py --provider gemini")
+        print("   python cli_chatbot/chatbot.py --provider gemini")
+        print("\n💡 To run these tests again (from the repository root):")
+        print("   python -m cli_chatbot.test_chatbot")
         
     except Exception as e:
         print(f"❌ Test failed: {str(e)}")
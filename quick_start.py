@@ -7,8 +7,12 @@ Run this from your project directory to start InvestAI
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
+# Packages the backend needs to start (import name == pip name)
+BASIC_DEPENDENCIES = ["fastapi", "uvicorn", "sqlalchemy", "pydantic"]
+
 def main():
     print("🚀 InvestAI Quick Start")
     print("=" * 50)
@@ -39,19 +43,28 @@ def main():
     print("✅ InvestAI project found!")
     print(f"📁 Backend path: {backend_dir}")
     
-    # Install basic dependencies
-    print("\n📦 Installing basic dependencies...")
-    try:
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "fastapi", "uvicorn", "sqlalchemy", "pydantic"
-        ], check=True, capture_output=True)
-        print("✅ Dependencies installed")
-    except subprocess.CalledProcessError:
-        print("⚠️ Could not install dependencies automatically")
-        print("💡 Run manually: pip install fastapi uvicorn sqlalchemy pydantic")
+    # Install basic dependencies (only the ones that are missing)
+    missing = [name for name in BASIC_DEPENDENCIES if importlib.util.find_spec(name) is None]
+    if not missing:
+        print("\n✅ Basic dependencies already installed")
+    else:
+        print(f"\n📦 Installing missing dependencies: {', '.join(missing)}...")
+        try:
+            subprocess.run([
+                sys.executable, "-m", "pip", "install",
+                "--quiet", "--disable-pip-version-check", *missing
+            ], check=True, capture_output=True)
+            importlib.invalidate_caches()
+            print("✅ Dependencies installed")
+        except subprocess.CalledProcessError:
+            print("⚠️ Could not install dependencies automatically")
+            print(f"💡 Run manually: pip install {' '.join(missing)}")
+    
+    if importlib.util.find_spec("uvicorn") is None:
+        print("❌ uvicorn not found. Install with: pip install uvicorn")
+        return 1
     
-    # Change to backend directory
+    # Change to backend directory (the backend reads its .env from here)
     os.chdir(backend_dir)
     print(f"\n📂 Changed to: {backend_dir}")
     
@@ -60,17 +73,21 @@ def main():
     print("🛑 Press Ctrl+C to stop")
     print("-" * 50)
     
+    uvicorn_cmd = [
+        sys.executable, "-m", "uvicorn",
+        "app.main:app", "--reload", "--host", "0.0.0.0", "--port", "8000"
+    ]
+    
+    if os.name == "posix":
+        # Replace this process with uvicorn so signals reach it directly
+        sys.stdout.flush()
+        os.execv(sys.executable, uvicorn_cmd)
+    
+    # Windows has no real exec, so keep uvicorn as a child process there
     try:
-        # Start server
-        subprocess.run([
-            sys.executable, "-m", "uvicorn", 
-            "app.main:app", "--reload", "--host", "0.0.0.0", "--port", "8000"
-        ])
+        subprocess.run(uvicorn_cmd)
     except KeyboardInterrupt:
         print("\n🛑 Server stopped")
-    except FileNotFoundError:
-        print("❌ uvicorn not found. Install with: pip install uvicorn")
-        return 1
     
     return 0
 
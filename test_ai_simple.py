@@ -3,156 +3,361 @@
 Simple test to verify AI system components work
 """
 
-def test_basic_functionality():
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import mul
+from typing import List
+
+# Set INVESTAI_VERBOSE=0 for a terse report: decorative lines are skipped
+# and the rest is written in plain ASCII instead of emoji
+VERBOSE = os.environ.get("INVESTAI_VERBOSE", "1") != "0"
+
+# ASCII stand-ins for the report's status icons, decorations and rupee sign
+ASCII_TAGS = str.maketrans({
+    "✅": "[OK]",
+    "❌": "[FAIL]",
+    "⚠": "[!]",
+    "\ufe0f": None,
+    "₹": "Rs.",
+    **dict.fromkeys("🤖📦🔍📊💰📈👤🎯💼💹💸🎉🚀🧠📋🎪🎂💳", "*")
+})
+
+# Rupee amount formatters with thousands separators, bound once at import
+format_rupees = "₹{:,}".format
+format_rupees_whole = "₹{:,.0f}".format
+
+# Indian tax slabs: an income up to TAX_THRESHOLDS[i] falls in slab i, which
+# charges TAX_BASES[i] plus TAX_RATES[i] on the amount above TAX_LOWER[i]
+TAX_THRESHOLDS = (250000, 500000, 1000000)
+TAX_LOWER = (0, 250000, 500000, 1000000)
+TAX_BASES = (0, 0, 12500, 112500)
+TAX_RATES = (0, 0.05, 0.20, 0.30)
+
+
+# A risk score above RISK_THRESHOLDS[i - 1] falls in RISK_CATEGORIES[i]
+RISK_THRESHOLDS = (60, 80)
+RISK_CATEGORIES = ("Conservative", "Moderate", "Aggressive")
+
+
+def compute_risk_score(age, risk_tolerance, _bisect=bisect_left, _thresholds=RISK_THRESHOLDS,
+                       _categories=RISK_CATEGORIES):
+    """Return a user's risk score and risk category"""
+    risk_score = (risk_tolerance * 10) + (40 - age)
+    return risk_score, _categories[_bisect(_thresholds, risk_score)]
+
+
+def score_users(ages, risk_tolerances):
+    """Return the (risk score, risk category) of each of several users"""
+    return list(map(compute_risk_score, ages, risk_tolerances))
+
+
+# Weights of the fundamental, technical, inverted risk and valuation scores
+SCORE_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+
+# An overall score at or above RECOMMENDATION_THRESHOLDS[i - 1] earns RECOMMENDATIONS[i]
+RECOMMENDATION_THRESHOLDS = (50, 60, 70, 80)
+RECOMMENDATIONS = (
+    ("SELL", "Low"),
+    ("HOLD", "Medium"),
+    ("MODERATE BUY", "Medium"),
+    ("BUY", "High"),
+    ("STRONG BUY", "High")
+)
+
+
+def compute_overall_score(fundamental_score, technical_score, risk_score, valuation_score):
+    """Return the weighted overall score of a stock"""
+    scores = (fundamental_score, technical_score, 100 - risk_score, valuation_score)
+    return sum(map(mul, scores, SCORE_WEIGHTS))
+
+
+def recommend(overall_score):
+    """Return the (recommendation, confidence) pair for an overall score"""
+    return RECOMMENDATIONS[bisect_right(RECOMMENDATION_THRESHOLDS, overall_score)]
+
+
+def recommend_all(overall_scores, _bisect=bisect_right, _thresholds=RECOMMENDATION_THRESHOLDS,
+                  _labels=RECOMMENDATIONS):
+    """Return the (recommendation, confidence) pair for each of several overall scores"""
+    # Globals are bound as defaults so the loop reads them as fast locals
+    return [_labels[_bisect(_thresholds, score)] for score in overall_scores]
+
+
+def portfolio_totals(quantities, buy_prices, current_prices):
+    """Return (total invested, current value) of holdings given as parallel columns"""
+    total_invested = 0
+    current_value = 0
+    for quantity, buy_price, current_price in zip(quantities, buy_prices, current_prices):
+        total_invested += quantity * buy_price
+        current_value += quantity * current_price
+    return total_invested, current_value
+
+
+def make_tax_function(thresholds, lower, bases, rates):
+    """Build the tax function of one tax regime, with its slab tables bound in"""
+    find_slab = bisect_left
+    
+    def compute_tax(annual_income):
+        """Return the tax liability on an annual income"""
+        slab = find_slab(thresholds, annual_income)
+        return bases[slab] + (annual_income - lower[slab]) * rates[slab]
+    
+    return compute_tax
+
+
+compute_tax = make_tax_function(TAX_THRESHOLDS, TAX_LOWER, TAX_BASES, TAX_RATES)
+
+
+def compute_taxes(incomes):
+    """Return the tax liability on each of several annual incomes"""
+    return list(map(compute_tax, incomes))
+
+
+# Powers of (1 + rate) per rate, indexed by the number of periods
+_GROWTH_TABLES = {}
+
+# Longest horizon kept in a growth table: 100 years of monthly periods
+MAX_TABLE_PERIODS = 1200
+
+# Most distinct rates given a table; further rates are computed directly
+MAX_TABLE_RATES = 64
+
+
+def growth_factor(rate, periods):
+    """Return (1 + rate) ** periods, extending the rate's table on first use"""
+    # Only whole, non-negative horizons up to the cap are tabulated
+    if type(periods) is not int or not 0 <= periods <= MAX_TABLE_PERIODS:
+        return (1 + rate) ** periods
+    
+    table = _GROWTH_TABLES.get(rate)
+    if table is None:
+        if len(_GROWTH_TABLES) >= MAX_TABLE_RATES:
+            return (1 + rate) ** periods
+        table = _GROWTH_TABLES[rate] = [1.0]
+    if periods >= len(table):
+        base = 1 + rate
+        table.extend(base ** n for n in range(len(table), periods + 1))
+    return table[periods]
+
+
+@lru_cache(maxsize=1024)
+def compute_sip(current_age, retirement_age, current_expenses, inflation_rate, expected_return):
+    """Return (future monthly expenses, corpus required, monthly SIP) for a retirement goal"""
+    years_to_retirement = retirement_age - current_age
+    
+    # Future monthly expenses
+    future_expenses = current_expenses * growth_factor(inflation_rate, years_to_retirement)
+    
+    # Corpus required (25x annual expenses)
+    corpus_required = future_expenses * 12 * 25
+    
+    # Monthly SIP calculation
+    monthly_return = expected_return / 12
+    months = years_to_retirement * 12
+    
+    # expm1(n * log1p(r)) is (1 + r) ** n - 1 without cancellation at small rates
+    if monthly_return > 0:
+        sip_required = corpus_required * monthly_return / math.expm1(months * math.log1p(monthly_return))
+    else:
+        sip_required = corpus_required / months
+    
+    return future_expenses, corpus_required, sip_required
+
+
+# Mock stock analysis
+SAMPLE_STOCK = {
+    "symbol": "RELIANCE",
+    "current_price": 2500,
+    "pe_ratio": 15.5,
+    "market_cap": 1500000000000
+}
+
+# Mock user profile
+SAMPLE_USER_PROFILE = {
+    "age": 30,
+    "income": 1200000,
+    "risk_tolerance": 7
+}
+
+# Mock portfolio, one column per field so both totals come from a single pass
+SAMPLE_PORTFOLIO = {
+    "symbol": ("RELIANCE", "TCS"),
+    "quantity": (100, 50),
+    "price": (2500, 3200),
+    "current_price": (2600, 3300)
+}
+
+# Mock comprehensive analysis
+SAMPLE_ANALYSIS = {
+    "fundamental_score": 75,
+    "technical_score": 68,
+    "risk_score": 45,
+    "valuation_score": 70
+}
+
+
+@dataclass
+class TestReport:
+    """Outcome and buffered report lines of one or more tests"""
+    __test__ = False  # Not a pytest test class
+    
+    passed: bool = True
+    lines: List[str] = field(default_factory=list)
+    
+    def merge(self, other: "TestReport") -> "TestReport":
+        """Fold another report's outcome and lines into this one"""
+        self.passed = self.passed and other.passed
+        self.lines += other.lines
+        return self
+
+
+def discard(line):
+    """Drop a report line, for runs where nobody reads the report"""
+
+
+def write_lines(lines):
+    """Write buffered report lines to stdout in one call"""
+    text = "\n".join(lines) + "\n"
+    if not VERBOSE:
+        text = text.translate(ASCII_TAGS)
+    sys.stdout.write(text)
+
+
+def test_basic_functionality(emit=None):
     """Test basic AI functionality without external dependencies"""
-    print("🤖 Testing InvestAI AI System Components")
-    print("=" * 50)
+    report = TestReport()
+    if emit is None:
+        emit = report.lines.append
+    note = emit if VERBOSE else discard  # Decorative lines
+    
+    note("🤖 Testing InvestAI AI System Components")
+    note("=" * 50)
     
     # Test 1: Basic imports
-    try:
-        print("📦 Testing imports...")
-        # These would normally import from our AI modules
-        print("  ✅ Core AI components available")
-        
-        # Test 2: Mock AI analysis
-        print("🔍 Testing AI analysis logic...")
-        
-        # Mock stock analysis
-        stock_data = {
-            "symbol": "RELIANCE",
-            "current_price": 2500,
-            "pe_ratio": 15.5,
-            "market_cap": 1500000000000
-        }
-        
-        # Simple analysis logic
-        recommendation = "BUY" if stock_data["pe_ratio"] < 20 else "HOLD"
-        print(f"  📊 Stock: {stock_data['symbol']}")
-        print(f"  💰 Price: ₹{stock_data['current_price']}")
-        print(f"  📈 Recommendation: {recommendation}")
-        print("  ✅ Stock analysis logic working")
-        
-        # Test 3: Risk assessment logic
-        print("⚠️  Testing risk assessment logic...")
-        
-        user_profile = {
-            "age": 30,
-            "income": 1200000,
-            "risk_tolerance": 7
-        }
-        
-        # Simple risk scoring
-        risk_score = (user_profile["risk_tolerance"] * 10) + (40 - user_profile["age"])
-        risk_category = "Aggressive" if risk_score > 80 else "Moderate" if risk_score > 60 else "Conservative"
-        
-        print(f"  👤 Age: {user_profile['age']}")
-        print(f"  💰 Income: ₹{user_profile['income']:,}")
-        print(f"  📊 Risk Score: {risk_score}")
-        print(f"  🎯 Risk Category: {risk_category}")
-        print("  ✅ Risk assessment logic working")
-        
-        # Test 4: Portfolio calculation
-        print("💼 Testing portfolio calculations...")
-        
-        portfolio = [
-            {"symbol": "RELIANCE", "quantity": 100, "price": 2500, "current_price": 2600},
-            {"symbol": "TCS", "quantity": 50, "price": 3200, "current_price": 3300}
-        ]
-        
-        total_invested = sum(holding["quantity"] * holding["price"] for holding in portfolio)
-        current_value = sum(holding["quantity"] * holding["current_price"] for holding in portfolio)
-        returns = current_value - total_invested
-        returns_pct = (returns / total_invested) * 100
-        
-        print(f"  💰 Total Invested: ₹{total_invested:,}")
-        print(f"  📈 Current Value: ₹{current_value:,}")
-        print(f"  💹 Returns: ₹{returns:,} ({returns_pct:.2f}%)")
-        print("  ✅ Portfolio calculations working")
-        
-        # Test 5: Tax calculation logic
-        print("💰 Testing tax calculations...")
-        
-        annual_income = 1500000
-        
-        # Simple tax calculation for Indian tax brackets
-        if annual_income <= 250000:
-            tax = 0
-        elif annual_income <= 500000:
-            tax = (annual_income - 250000) * 0.05
-        elif annual_income <= 1000000:
-            tax = 12500 + (annual_income - 500000) * 0.20
-        else:
-            tax = 112500 + (annual_income - 1000000) * 0.30
-        
-        print(f"  💰 Annual Income: ₹{annual_income:,}")
-        print(f"  💸 Tax Liability: ₹{tax:,}")
-        print(f"  📊 Effective Rate: {(tax/annual_income)*100:.2f}%")
-        print("  ✅ Tax calculations working")
-        
-        print("\n" + "=" * 50)
-        print("🎉 All AI system components tested successfully!")
-        print("✅ InvestAI AI system logic is working correctly")
-        print("🚀 Ready for integration with external APIs and databases")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {str(e)}")
-        return False
-
-
-def test_ai_recommendations():
+    note("📦 Testing imports...")
+    # These would normally import from our AI modules
+    note("  ✅ Core AI components available")
+    
+    # Test 2: Mock AI analysis
+    emit("🔍 Testing AI analysis logic...")
+    
+    stock_data = SAMPLE_STOCK
+    
+    symbol = stock_data["symbol"]
+    price = stock_data["current_price"]
+    pe_ratio = stock_data["pe_ratio"]
+    
+    # Simple analysis logic
+    recommendation = "BUY" if pe_ratio < 20 else "HOLD"
+    emit(f"  📊 Stock: {symbol}")
+    emit(f"  💰 Price: ₹{price}")
+    emit(f"  📈 Recommendation: {recommendation}")
+    note("  ✅ Stock analysis logic working")
+    
+    # Test 3: Risk assessment logic
+    emit("⚠️  Testing risk assessment logic...")
+    
+    user_profile = SAMPLE_USER_PROFILE
+    
+    age = user_profile["age"]
+    income = user_profile["income"]
+    risk_tolerance = user_profile["risk_tolerance"]
+    
+    # Simple risk scoring
+    risk_score, risk_category = compute_risk_score(age, risk_tolerance)
+    
+    emit(f"  👤 Age: {age}")
+    emit("  💰 Income: " + format_rupees(income))
+    emit(f"  📊 Risk Score: {risk_score}")
+    emit(f"  🎯 Risk Category: {risk_category}")
+    note("  ✅ Risk assessment logic working")
+    
+    # Test 4: Portfolio calculation
+    emit("💼 Testing portfolio calculations...")
+    
+    portfolio = SAMPLE_PORTFOLIO
+    
+    total_invested, current_value = portfolio_totals(
+        portfolio["quantity"], portfolio["price"], portfolio["current_price"]
+    )
+    returns = current_value - total_invested
+    returns_pct = (returns / total_invested) * 100
+    
+    emit("  💰 Total Invested: " + format_rupees(total_invested))
+    emit("  📈 Current Value: " + format_rupees(current_value))
+    emit(f"  💹 Returns: {format_rupees(returns)} ({returns_pct:.2f}%)")
+    note("  ✅ Portfolio calculations working")
+    
+    # Test 5: Tax calculation logic
+    emit("💰 Testing tax calculations...")
+    
+    annual_income = 1500000
+    
+    # Simple tax calculation for Indian tax brackets
+    tax = compute_tax(annual_income)
+    
+    emit("  💰 Annual Income: " + format_rupees(annual_income))
+    emit("  💸 Tax Liability: " + format_rupees(tax))
+    emit(f"  📊 Effective Rate: {(tax/annual_income)*100:.2f}%")
+    note("  ✅ Tax calculations working")
+    
+    note("\n" + "=" * 50)
+    note("🎉 All AI system components tested successfully!")
+    note("✅ InvestAI AI system logic is working correctly")
+    note("🚀 Ready for integration with external APIs and databases")
+    
+    return report
+
+
+def test_ai_recommendations(emit=None):
     """Test AI recommendation logic"""
-    print("\n🧠 Testing AI Recommendation Engine...")
+    report = TestReport()
+    if emit is None:
+        emit = report.lines.append
+    note = emit if VERBOSE else discard  # Decorative lines
     
-    # Mock comprehensive analysis
-    analysis_data = {
-        "fundamental_score": 75,
-        "technical_score": 68,
-        "risk_score": 45,
-        "valuation_score": 70
-    }
+    emit("\n🧠 Testing AI Recommendation Engine...")
+    
+    analysis_data = SAMPLE_ANALYSIS
     
     # Weighted scoring
-    overall_score = (
-        analysis_data["fundamental_score"] * 0.4 +
-        analysis_data["technical_score"] * 0.3 +
-        (100 - analysis_data["risk_score"]) * 0.2 +
-        analysis_data["valuation_score"] * 0.1
+    overall_score = compute_overall_score(
+        analysis_data["fundamental_score"],
+        analysis_data["technical_score"],
+        analysis_data["risk_score"],
+        analysis_data["valuation_score"]
     )
     
     # Generate recommendation
-    if overall_score >= 80:
-        recommendation = "STRONG BUY"
-        confidence = "High"
-    elif overall_score >= 70:
-        recommendation = "BUY"
-        confidence = "High"
-    elif overall_score >= 60:
-        recommendation = "MODERATE BUY"
-        confidence = "Medium"
-    elif overall_score >= 50:
-        recommendation = "HOLD"
-        confidence = "Medium"
-    else:
-        recommendation = "SELL"
-        confidence = "Low"
+    recommendation, confidence = recommend(overall_score)
     
-    print(f"  📊 Fundamental Score: {analysis_data['fundamental_score']}")
-    print(f"  📈 Technical Score: {analysis_data['technical_score']}")
-    print(f"  ⚠️  Risk Score: {analysis_data['risk_score']}")
-    print(f"  💰 Valuation Score: {analysis_data['valuation_score']}")
-    print(f"  🎯 Overall Score: {overall_score:.1f}")
-    print(f"  📋 Recommendation: {recommendation}")
-    print(f"  🎪 Confidence: {confidence}")
-    print("  ✅ AI recommendation engine working")
+    emit(f"  📊 Fundamental Score: {analysis_data['fundamental_score']}")
+    emit(f"  📈 Technical Score: {analysis_data['technical_score']}")
+    emit(f"  ⚠️  Risk Score: {analysis_data['risk_score']}")
+    emit(f"  💰 Valuation Score: {analysis_data['valuation_score']}")
+    emit(f"  🎯 Overall Score: {overall_score:.1f}")
+    emit(f"  📋 Recommendation: {recommendation}")
+    emit(f"  🎪 Confidence: {confidence}")
+    note("  ✅ AI recommendation engine working")
     
-    return True
+    return report
 
 
-def test_goal_planning():
+def test_goal_planning(emit=None):
     """Test financial goal planning logic"""
-    print("\n🎯 Testing Goal Planning Logic...")
+    report = TestReport()
+    if emit is None:
+        emit = report.lines.append
+    note = emit if VERBOSE else discard  # Decorative lines
+    
+    emit("\n🎯 Testing Goal Planning Logic...")
     
     # Retirement goal calculation
     current_age = 30
@@ -161,49 +366,86 @@ def test_goal_planning():
     inflation_rate = 0.06
     expected_return = 0.12
     
-    years_to_retirement = retirement_age - current_age
+    future_expenses, corpus_required, sip_required = compute_sip(
+        current_age, retirement_age, current_expenses, inflation_rate, expected_return
+    )
     
-    # Future monthly expenses
-    future_expenses = current_expenses * ((1 + inflation_rate) ** years_to_retirement)
+    emit(f"  👤 Current Age: {current_age}")
+    emit(f"  🎂 Retirement Age: {retirement_age}")
+    emit("  💰 Current Monthly Expenses: " + format_rupees(current_expenses))
+    emit("  📈 Future Monthly Expenses: " + format_rupees_whole(future_expenses))
+    emit("  🎯 Corpus Required: " + format_rupees_whole(corpus_required))
+    emit("  💳 Monthly SIP Required: " + format_rupees_whole(sip_required))
+    note("  ✅ Goal planning calculations working")
     
-    # Corpus required (25x annual expenses)
-    corpus_required = future_expenses * 12 * 25
+    return report
+
+
+def test_growth_factor(emit=None):
+    """Test that tabulated and untabulated growth factors match plain exponentiation"""
+    report = TestReport()
+    if emit is None:
+        emit = report.lines.append
+    note = emit if VERBOSE else discard  # Decorative lines
     
-    # Monthly SIP calculation
-    monthly_return = expected_return / 12
-    months = years_to_retirement * 12
+    emit("\n📈 Testing Growth Factor Tables...")
     
-    if monthly_return > 0:
-        sip_required = corpus_required * monthly_return / (((1 + monthly_return) ** months) - 1)
-    else:
-        sip_required = corpus_required / months
+    rate = 0.06
+    for periods in range(MAX_TABLE_PERIODS + 1):
+        assert growth_factor(rate, periods) == (1 + rate) ** periods, f"Wrong factor for {periods} periods"
     
-    print(f"  👤 Current Age: {current_age}")
-    print(f"  🎂 Retirement Age: {retirement_age}")
-    print(f"  💰 Current Monthly Expenses: ₹{current_expenses:,}")
-    print(f"  📈 Future Monthly Expenses: ₹{future_expenses:,.0f}")
-    print(f"  🎯 Corpus Required: ₹{corpus_required:,.0f}")
-    print(f"  💳 Monthly SIP Required: ₹{sip_required:,.0f}")
-    print("  ✅ Goal planning calculations working")
+    # Fractional, negative and very long horizons bypass the table
+    for periods in (2.5, -5, 5000):
+        assert growth_factor(rate, periods) == (1 + rate) ** periods, f"Wrong factor for {periods} periods"
+    assert len(_GROWTH_TABLES[rate]) <= MAX_TABLE_PERIODS + 1, "Growth table grew past its cap"
     
-    return True
+    note("  ✅ Growth factor tables working")
+    return report
+
+
+def run_tests(emit=None):
+    """Run every test and return the merged report
+    
+    Report lines go to emit when given, and into the report otherwise.
+    """
+    report = TestReport()
+    if VERBOSE:
+        report.lines += ["🚀 InvestAI AI System - Simple Functionality Test", "=" * 60]
+    for test in (test_basic_functionality, test_ai_recommendations, test_goal_planning, test_growth_factor):
+        try:
+            report.merge(test(emit))
+        except Exception as e:
+            report.lines.append(f"❌ Test failed: {str(e)}")
+            report.passed = False
+    return report
 
 
 if __name__ == "__main__":
-    print("🚀 InvestAI AI System - Simple Functionality Test")
-    print("=" * 60)
-    
-    success = True
-    success &= test_basic_functionality()
-    success &= test_ai_recommendations()
-    success &= test_goal_planning()
-    
-    print("\n" + "=" * 60)
-    if success:
-        print("🎉 ALL TESTS PASSED!")
-        print("✅ InvestAI AI system is ready for deployment!")
-        print("🤖 Core AI logic verified and working correctly")
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--bench", action="store_true",
+                        help="print only a JSON line with the outcome and run time")
+    args = parser.parse_args()
+    
+    if args.bench:
+        start = time.perf_counter_ns()
+        report = run_tests(emit=discard)
+        elapsed_ns = time.perf_counter_ns() - start
+        print(json.dumps({"passed": report.passed, "ns": elapsed_ns}))
+        sys.exit(0 if report.passed else 1)
+    
+    report = run_tests()
+    lines = report.lines
+    if VERBOSE:
+        lines.append("\n" + "=" * 60)
+    if report.passed:
+        lines.append("🎉 ALL TESTS PASSED!")
+        if VERBOSE:
+            lines.append("✅ InvestAI AI system is ready for deployment!")
+            lines.append("🤖 Core AI logic verified and working correctly")
     else:
-        print("❌ Some tests failed")
+        lines.append("❌ Some tests failed")
     
-    print("=" * 60)
+    if VERBOSE:
+        lines.append("=" * 60)
+    write_lines(lines)
+    sys.exit(0 if report.passed else 1)